@@ -1,5 +1,18 @@
 "use client";
-import { useState } from "react";
+import { useMemo, useState } from "react";
+import type { ChangeEvent } from "react";
+
+const SLIDER_KEYS = [
+  "ocean",
+  "axialTilt",
+  "orbitalDist",
+  "rotationPeriod",
+  "cloudCover",
+  "tectonic",
+  "planetSize",
+] as const;
+type SliderKey = (typeof SLIDER_KEYS)[number];
+type SliderHandler = (e: ChangeEvent<HTMLInputElement>) => void;
 
 export default function ControlPanel({
   ocean,
@@ -40,9 +53,21 @@ export default function ControlPanel({
     if (onGenerate) onGenerate(localValues as Record<string, number>);
   };
 
-  const handleSlider = (key: string, value: number) => {
-    setLocalValues((prev) => ({ ...prev, [key]: value }));
-  };
+  // Build one stable change handler per slider up front instead of a new
+  // closure per slider on every render
+  const sliderHandlers = useMemo(
+    () =>
+      Object.fromEntries(
+        SLIDER_KEYS.map((key) => [
+          key,
+          (e: ChangeEvent<HTMLInputElement>) => {
+            const value = parseFloat(e.target.value);
+            setLocalValues((prev) => ({ ...prev, [key]: value }));
+          },
+        ])
+      ) as Record<SliderKey, SliderHandler>,
+    []
+  );
 
   return (
     <div className="w-full bg-gray-900/60 border-b border-gray-800 px-4 py-2 flex items-center gap-4">
@@ -56,7 +81,7 @@ export default function ControlPanel({
             max={1}
             step={0.01}
             value={localValues.ocean}
-            onChange={(e) => handleSlider("ocean", parseFloat(e.target.value))}
+            onChange={sliderHandlers.ocean}
           />
         </div>
 
@@ -69,7 +94,7 @@ export default function ControlPanel({
             max={90}
             step={0.01}
             value={localValues.axialTilt}
-            onChange={(e) => handleSlider("axialTilt", parseFloat(e.target.value))}
+            onChange={sliderHandlers.axialTilt}
           />
         </div>
 
@@ -82,7 +107,7 @@ export default function ControlPanel({
             max={10}
             step={0.01}
             value={localValues.orbitalDist}
-            onChange={(e) => handleSlider("orbitalDist", parseFloat(e.target.value))}
+            onChange={sliderHandlers.orbitalDist}
           />
         </div>
 
@@ -95,7 +120,7 @@ export default function ControlPanel({
             max={1000}
             step={0.1}
             value={localValues.rotationPeriod}
-            onChange={(e) => handleSlider("rotationPeriod", parseFloat(e.target.value))}
+            onChange={sliderHandlers.rotationPeriod}
           />
         </div>
 
@@ -108,7 +133,7 @@ export default function ControlPanel({
             max={1}
             step={0.01}
             value={localValues.cloudCover}
-            onChange={(e) => handleSlider("cloudCover", parseFloat(e.target.value))}
+            onChange={sliderHandlers.cloudCover}
             disabled
           />
         </div>
@@ -122,7 +147,7 @@ export default function ControlPanel({
             max={10}
             step={0.01}
             value={localValues.tectonic}
-            onChange={(e) => handleSlider("tectonic", parseFloat(e.target.value))}
+            onChange={sliderHandlers.tectonic}
           />
         </div>
 
@@ -135,7 +160,7 @@ export default function ControlPanel({
             max={5}
             step={0.01}
             value={localValues.planetSize}
-            onChange={(e) => handleSlider("planetSize", parseFloat(e.target.value))}
+            onChange={sliderHandlers.planetSize}
           />
         </div>
       </div>
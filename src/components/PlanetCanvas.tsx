@@ -35,7 +35,7 @@ export default function PlanetCanvas(props: PlanetCanvasProps & { surfaceTempK?:
     );
     const relativeLuminosity = star.luminosityWatts / PHYSICAL_CONSTANTS.SOLAR_LUMINOSITY_WATTS;
     const primaryIntensity = useMemo(
-        () => 2.2 * relativeLuminosity / Math.pow(distanceFactor, 2),
+        () => 2.2 * relativeLuminosity / (distanceFactor * distanceFactor),
         [relativeLuminosity, distanceFactor]
     );
     const starColor = useMemo(() => new THREE.Color(star.colorHex), [star.colorHex]);
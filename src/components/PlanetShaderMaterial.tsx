@@ -46,7 +46,8 @@ export function createPlanetShaderMaterial(overrides: PartialUniforms = {}) {
     blend45: { value: 0.168 },
   };
 
-  const uniforms = { ...defaults, ...overrides } as Record<string, THREE.IUniform<unknown>>;
+  // `defaults` is built fresh per call, so apply overrides in place rather than spreading into a copy
+  const uniforms = Object.assign(defaults, overrides) as Record<string, THREE.IUniform<unknown>>;
 
   const material = new THREE.ShaderMaterial({
     uniforms,
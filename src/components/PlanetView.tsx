@@ -19,18 +19,20 @@ import {
 } from "@/lib/physics";
 
 export default function PlanetView({config}: PlanetViewProps) {
-    const [planetSize, setPlanetSize] = useState(config.params.physical.radius_scale);
-    const [orbitalDist, setOrbitalDist] = useState(config.params.stellar.orbital_distance);
-    const [rotationPeriod, setRotationPeriod] = useState(config.params.stellar.rotation_period_hours);
-    const [axialTilt, setAxialTilt] = useState(config.params.stellar.axial_tilt);
-    const [cloudCover, setCloudCover] = useState(config.params.atmosphere.cloud_cover);
-    const [tectonic, setTectonic] = useState(config.params.hydrology.tectonic_activity);
-    const [ocean, setOcean] = useState(config.params.hydrology.ocean);
-    const massKg = config.params.physical.mass;
-    const rawComposition = config.params.atmosphere?.composition;
+    // Resolve each config section once instead of walking config.params per field
+    const { physical, stellar, atmosphere, hydrology } = config.params;
+    const [planetSize, setPlanetSize] = useState(physical.radius_scale);
+    const [orbitalDist, setOrbitalDist] = useState(stellar.orbital_distance);
+    const [rotationPeriod, setRotationPeriod] = useState(stellar.rotation_period_hours);
+    const [axialTilt, setAxialTilt] = useState(stellar.axial_tilt);
+    const [cloudCover, setCloudCover] = useState(atmosphere.cloud_cover);
+    const [tectonic, setTectonic] = useState(hydrology.tectonic_activity);
+    const [ocean, setOcean] = useState(hydrology.ocean);
+    const massKg = physical.mass;
+    const rawComposition = atmosphere?.composition;
     const composition = useMemo(() => rawComposition ?? {}, [rawComposition]);
-    const starType = config.params.stellar.star_type;
-    const greenhouseIndex = config.params.atmosphere?.greenhouse_index ?? 1;
+    const starType = stellar.star_type;
+    const greenhouseIndex = atmosphere?.greenhouse_index ?? 1;
 
     const surfaceGravity = useMemo(
         () => calculateSurfaceGravity({ massKg, radiusScale: planetSize }),
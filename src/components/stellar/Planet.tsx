@@ -24,6 +24,12 @@ const MAX_PLATE_COUNT = 15; // Maximum number of tectonic plates
 const BASE_PLATE_COUNT = 2; // Base offset for plate count calculation
 const TECTONIC_PLATE_MULTIPLIER = 1.2; // Scales tectonic slider to plate count
 
+// Recently generated coarse elevation maps, keyed on their inputs, so dragging a
+// slider back to an earlier value skips plate generation. Each entry is
+// TEXTURE_SIZE² floats (~4 MB), so only a few are kept (least recently used first out).
+const COARSE_MAP_CACHE_SIZE = 4;
+const coarseMapCache = new Map<string, Float32Array>();
+
 export default function Planet({
     gravity: _gravity,
     ocean,
@@ -114,8 +120,22 @@ export default function Planet({
       // Use a seed based on tectonic and ocean values for reproducibility
       const seed = Math.floor((tectonic * 1000 + oceanFraction * 10000) % 100000);
       
+      const cacheKey = `${seed}:${plateCount}:${mapSize}:${oceanFraction}:${gravityFactor}`;
+      const cached = coarseMapCache.get(cacheKey);
+      if (cached) {
+        // Re-insert to mark as most recently used
+        coarseMapCache.delete(cacheKey);
+        coarseMapCache.set(cacheKey, cached);
+        return cached;
+      }
+
       const plateMap = generatePlateMap(seed, plateCount, mapSize, oceanFraction);
-      return computeCoarseElevation(plateMap, gravityFactor, oceanFraction);
+      const elevation = computeCoarseElevation(plateMap, gravityFactor, oceanFraction);
+      coarseMapCache.set(cacheKey, elevation);
+      if (coarseMapCache.size > COARSE_MAP_CACHE_SIZE) {
+        coarseMapCache.delete(coarseMapCache.keys().next().value as string);
+      }
+      return elevation;
     }, [tectonic, oceanFraction, gravityFactor]);
 
     // === TEXTURE, NORMAL, & DISPLACEMENT MAP GENERATION ===
@@ -289,6 +309,15 @@ export default function Planet({
       const actualOceanFraction = oceanPixels / totalPixels;
       const effectiveOceanFraction = THREE.MathUtils.clamp(actualOceanFraction, 0.02, 0.98);
 
+      // Palette constants and scratch colors for the second pass, created once
+      // rather than parsed/allocated per texel
+      const rockColor = new THREE.Color("#8b8d8f");
+      const snowColor = new THREE.Color("#f7f7f9");
+      const shallowWaterColor = new THREE.Color("#2a84c9");
+      const shorelineColor = new THREE.Color("#2a5aa5");
+      const color = new THREE.Color();
+      const finalColor = new THREE.Color();
+
       // Second pass: color, displacement and texture data using the resolved sea level
       for (let y = 0; y < size; y++) {
         for (let x = 0; x < size; x++) {
@@ -302,10 +331,20 @@ export default function Planet({
           const latitude = 1 - Math.abs(y / size - 0.5) * 2;
           const polar = Math.max(0, 1 - latitude * 2.2);
   
-          const color = new THREE.Color();
-          if (e > seaLevel) {
+          // Normalized height above sea level (0 to 1 for land) or depth below it
+          // (0 to 1 for ocean), shared by the color and displacement assignments
+          const isLand = e > seaLevel;
+          let landNorm = 0;
+          let depthNorm = 0;
+          if (isLand) {
             const landRatio = THREE.MathUtils.clamp((e - seaLevel) / landDenominator, 0, 1);
-            const landNorm = THREE.MathUtils.clamp((landRatio - minLandLift) / (1 - minLandLift), 0, 1);
+            landNorm = THREE.MathUtils.clamp((landRatio - minLandLift) / (1 - minLandLift), 0, 1);
+          } else {
+            const depthRatio = THREE.MathUtils.clamp((seaLevel - e) / oceanDenominator, 0, 1);
+            depthNorm = THREE.MathUtils.clamp((depthRatio - minOceanDepth) / (1 - minOceanDepth), 0, 1);
+          }
+
+          if (isLand) {
             const tempFactor = THREE.MathUtils.clamp(1 - Math.abs(latitude - 0.5) * 2, 0, 1);
             const dryness = THREE.MathUtils.clamp(
               0.35 +
@@ -324,15 +363,13 @@ export default function Planet({
   
             if (landNorm > 0.55) {
               const rockBlend = THREE.MathUtils.clamp((landNorm - 0.55) / 0.25, 0, 1);
-              color.lerp(new THREE.Color("#8b8d8f"), rockBlend);
+              color.lerp(rockColor, rockBlend);
             }
             if (landNorm > 0.8) {
               const snowBlend = Math.min((landNorm - 0.8) / 0.2 + polar * 0.5, 1);
-              color.lerp(new THREE.Color("#f7f7f9"), snowBlend);
+              color.lerp(snowColor, snowBlend);
             }
           } else {
-            const depthRatio = THREE.MathUtils.clamp((seaLevel - e) / oceanDenominator, 0, 1);
-            const depthNorm = THREE.MathUtils.clamp((depthRatio - minOceanDepth) / (1 - minOceanDepth), 0, 1);
             const hue = 0.58;
             const saturation = THREE.MathUtils.clamp(0.55 - depthNorm * 0.1, 0.4, 0.65);
             const lightness = THREE.MathUtils.clamp(0.18 + (1 - depthNorm) * 0.2, 0.15, 0.45);
@@ -340,12 +377,11 @@ export default function Planet({
 
             if (depthNorm < 0.3) {
               const shallowBlend = THREE.MathUtils.clamp((0.3 - depthNorm) / 0.3, 0, 1);
-              color.lerp(new THREE.Color("#2a84c9"), shallowBlend);
+              color.lerp(shallowWaterColor, shallowBlend);
             }
           }
 
-          const shorelineColor = new THREE.Color("#2a5aa5");
-          const finalColor = new THREE.Color().lerpColors(shorelineColor, color, shorelineBlend);
+          finalColor.lerpColors(shorelineColor, color, shorelineBlend);
           
           // Final Color Map Assignment
           const i = (y * size + x) * 4;
@@ -358,19 +394,14 @@ export default function Planet({
           const displacementBase = 0.5;
           let displacementValue = displacementBase; 
   
-          const isLand = e > seaLevel;
           if (isLand) {
               // Land: Push outwards from the 0.5 base
-              const landRatio = THREE.MathUtils.clamp((e - seaLevel) / landDenominator, 0, 1);
-              const h_land = THREE.MathUtils.clamp((landRatio - minLandLift) / (1 - minLandLift), 0, 1); // 0 to 1 for land
               // Max height is +50% of the possible range above base (0.5 to 1.0)
-              displacementValue = displacementBase + h_land * 0.5 * TERRAIN_CONTRAST; 
+              displacementValue = displacementBase + landNorm * 0.5 * TERRAIN_CONTRAST; 
           } else {
               // Ocean: Sink slightly inwards
-              const depthRatio = THREE.MathUtils.clamp((seaLevel - e) / oceanDenominator, 0, 1);
-              const d_ocean = THREE.MathUtils.clamp((depthRatio - minOceanDepth) / (1 - minOceanDepth), 0, 1); // 0 to 1 for ocean depth
               // Max depth is -10% of the possible range below base (0.5 to 0.4)
-              displacementValue = displacementBase - d_ocean * 0.1; 
+              displacementValue = displacementBase - depthNorm * 0.1; 
           }
   
           // Clamp to ensure valid displacement values [0, 1]
@@ -1,7 +1,18 @@
 import "server-only";
-import { readFile } from "node:fs/promises";
+import { readFile, stat } from "node:fs/promises";
+
+const CONFIG_PATH = "config.json";
+
+// Parsed config keyed on the file's mtime, so edits are still picked up
+// without re-reading and re-parsing the file on every request.
+let cachedConfig: { mtimeMs: number; data: ReturnType<typeof JSON.parse> } | null = null;
 
 export async function loadConfig() {
-  const raw = await readFile("config.json", "utf8");
-  return JSON.parse(raw);
+  const { mtimeMs } = await stat(CONFIG_PATH);
+  if (!cachedConfig || cachedConfig.mtimeMs !== mtimeMs) {
+    const raw = await readFile(CONFIG_PATH, "utf8");
+    cachedConfig = { mtimeMs, data: JSON.parse(raw) };
+  }
+  // Hand out a copy so callers can never mutate the cached template
+  return structuredClone(cachedConfig.data);
 }
@@ -573,7 +573,7 @@ export function calculateOrbitalPeriod({
     2 *
     Math.PI *
     Math.sqrt(
-      Math.pow(semiMajorAxisMeters, 3) /
+      (semiMajorAxisMeters * semiMajorAxisMeters * semiMajorAxisMeters) /
         (GRAVITATIONAL_CONSTANT * star.massKg)
     );
   return {
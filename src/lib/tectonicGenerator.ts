@@ -88,41 +88,56 @@ export function generatePlateMap(
     });
   }
 
+  // Precompute seed positions as Cartesian coordinates in flat arrays so the
+  // per-pixel search below is pure arithmetic instead of repeated trig calls
+  const seedX = new Float64Array(plateCount);
+  const seedY = new Float64Array(plateCount);
+  const seedZ = new Float64Array(plateCount);
+  for (let i = 0; i < plateCount; i++) {
+    const sTheta = seedPoints[i].u * Math.PI * 2;
+    const sPhi = seedPoints[i].v * Math.PI;
+    seedX[i] = Math.sin(sPhi) * Math.cos(sTheta);
+    seedY[i] = Math.cos(sPhi);
+    seedZ[i] = Math.sin(sPhi) * Math.sin(sTheta);
+  }
+
+  // Longitude terms only depend on x and latitude terms only on y,
+  // so evaluate them once per column/row rather than once per pixel
+  const cosTheta = new Float64Array(mapSize);
+  const sinTheta = new Float64Array(mapSize);
+  for (let x = 0; x < mapSize; x++) {
+    const theta = (x / mapSize) * Math.PI * 2;
+    cosTheta[x] = Math.cos(theta);
+    sinTheta[x] = Math.sin(theta);
+  }
+
   // Step 2: Flood-fill using Voronoi-like assignment
   // For each pixel, assign it to the nearest seed point
   for (let y = 0; y < mapSize; y++) {
-    for (let x = 0; x < mapSize; x++) {
-      const u = x / mapSize;
-      const v = y / mapSize;
+    const phi = (y / mapSize) * Math.PI;
+    const sinPhi = Math.sin(phi);
+    const py = Math.cos(phi);
 
+    for (let x = 0; x < mapSize; x++) {
       // Convert to spherical coordinates
-      const theta = u * Math.PI * 2;
-      const phi = v * Math.PI;
-      const px = Math.sin(phi) * Math.cos(theta);
-      const py = Math.cos(phi);
-      const pz = Math.sin(phi) * Math.sin(theta);
+      const px = sinPhi * cosTheta[x];
+      const pz = sinPhi * sinTheta[x];
 
       let minDist = Infinity;
       let closestPlate = 0;
 
       // Find closest seed point by Euclidean distance (faster than spherical distance)
       // Since we only need relative distances for Voronoi assignment, squared distance is sufficient
-      for (const seed of seedPoints) {
-        const sTheta = seed.u * Math.PI * 2;
-        const sPhi = seed.v * Math.PI;
-        const sx = Math.sin(sPhi) * Math.cos(sTheta);
-        const sy = Math.cos(sPhi);
-        const sz = Math.sin(sPhi) * Math.sin(sTheta);
-
+      for (let i = 0; i < plateCount; i++) {
         // Squared Euclidean distance (avoids expensive acos)
-        const dx = px - sx;
-        const dy = py - sy;
-        const dz = pz - sz;
+        const dx = px - seedX[i];
+        const dy = py - seedY[i];
+        const dz = pz - seedZ[i];
         const distSq = dx * dx + dy * dy + dz * dz;
 
         if (distSq < minDist) {
           minDist = distSq;
-          closestPlate = seed.id;
+          closestPlate = i;
         }
       }
 
@@ -12,34 +12,42 @@ function mix(a: number, b: number, t: number) {
   return a * (1 - t) + b * t;
 }
 
-function hash13(p: Vec3) {
+function hash13(x: number, y: number, z: number) {
   // Simple, fast pseudo-random based on dot and sin
-  const h = Math.sin(p.x * 127.1 + p.y * 311.7 + p.z * 74.7) * 43758.5453;
+  const h = Math.sin(x * 127.1 + y * 311.7 + z * 74.7) * 43758.5453;
   return fract(h);
 }
 
-function simpleNoise(p: Vec3) {
-  const i = { x: Math.floor(p.x), y: Math.floor(p.y), z: Math.floor(p.z) };
-  const f = { x: fract(p.x), y: fract(p.y), z: fract(p.z) };
+// Takes scalar components rather than a Vec3 so the hot path stays
+// allocation-free and monomorphic for the JIT.
+function simpleNoise(px: number, py: number, pz: number) {
+  const ix = Math.floor(px);
+  const iy = Math.floor(py);
+  const iz = Math.floor(pz);
+  const fx = px - ix;
+  const fy = py - iy;
+  const fz = pz - iz;
   // Smoothstep cubic
-  const u = { x: f.x * f.x * (3 - 2 * f.x), y: f.y * f.y * (3 - 2 * f.y), z: f.z * f.z * (3 - 2 * f.z) };
+  const ux = fx * fx * (3 - 2 * fx);
+  const uy = fy * fy * (3 - 2 * fy);
+  const uz = fz * fz * (3 - 2 * fz);
 
-  const n000 = hash13({ x: i.x + 0, y: i.y + 0, z: i.z + 0 });
-  const n100 = hash13({ x: i.x + 1, y: i.y + 0, z: i.z + 0 });
-  const n010 = hash13({ x: i.x + 0, y: i.y + 1, z: i.z + 0 });
-  const n110 = hash13({ x: i.x + 1, y: i.y + 1, z: i.z + 0 });
-  const n001 = hash13({ x: i.x + 0, y: i.y + 0, z: i.z + 1 });
-  const n101 = hash13({ x: i.x + 1, y: i.y + 0, z: i.z + 1 });
-  const n011 = hash13({ x: i.x + 0, y: i.y + 1, z: i.z + 1 });
-  const n111 = hash13({ x: i.x + 1, y: i.y + 1, z: i.z + 1 });
+  const n000 = hash13(ix + 0, iy + 0, iz + 0);
+  const n100 = hash13(ix + 1, iy + 0, iz + 0);
+  const n010 = hash13(ix + 0, iy + 1, iz + 0);
+  const n110 = hash13(ix + 1, iy + 1, iz + 0);
+  const n001 = hash13(ix + 0, iy + 0, iz + 1);
+  const n101 = hash13(ix + 1, iy + 0, iz + 1);
+  const n011 = hash13(ix + 0, iy + 1, iz + 1);
+  const n111 = hash13(ix + 1, iy + 1, iz + 1);
 
-  const nx00 = mix(n000, n100, u.x);
-  const nx10 = mix(n010, n110, u.x);
-  const nx01 = mix(n001, n101, u.x);
-  const nx11 = mix(n011, n111, u.x);
-  const nxy0 = mix(nx00, nx10, u.y);
-  const nxy1 = mix(nx01, nx11, u.y);
-  return mix(nxy0, nxy1, u.z) * 2 - 1;
+  const nx00 = mix(n000, n100, ux);
+  const nx10 = mix(n010, n110, ux);
+  const nx01 = mix(n001, n101, ux);
+  const nx11 = mix(n011, n111, ux);
+  const nxy0 = mix(nx00, nx10, uy);
+  const nxy1 = mix(nx01, nx11, uy);
+  return mix(nxy0, nxy1, uz) * 2 - 1;
 }
 
 export function fbm3(
@@ -53,7 +61,7 @@ export function fbm3(
   let sum = 0.0;
   let maxAmp = 0.0;
   for (let i = 0; i < octaves; i++) {
-    sum += amp * simpleNoise({ x: p.x * freq, y: p.y * freq, z: p.z * freq });
+    sum += amp * simpleNoise(p.x * freq, p.y * freq, p.z * freq);
     maxAmp += amp;
     amp *= persistence;
     freq *= lacunarity;
@@ -74,7 +82,7 @@ export function terrainHeight(
 ): number {
   let h = 0;
   if (type === 1) {
-    h = amplitude * simpleNoise({ x: v.x / period, y: v.y / period, z: v.z / period });
+    h = amplitude * simpleNoise(v.x / period, v.y / period, v.z / period);
   } else {
     const n = fbm3({ x: v.x / period, y: v.y / period, z: v.z / period }, persistence, lacunarity, octaves);
     if (type === 2) {
@@ -1,4 +1,3 @@
-import _noise from './noise.glsl';
 export const planetFragmentGLSL = `
 uniform int type;
 uniform float radius;
@@ -1,4 +1,3 @@
-import _noise from './noise.glsl';
 export const planetVertexGLSL = `
 // If geometry doesn't provide tangents, compute a simple fallback tangent from the normal
 uniform int type;
@@ -3,16 +3,23 @@
  */
 
 import { loadConfig } from '@/lib/config.server';
-import { readFile } from 'node:fs/promises';
+import { readFile, stat } from 'node:fs/promises';
 
 // Mock the fs/promises module
 jest.mock('node:fs/promises');
 
 const mockReadFile = readFile as jest.MockedFunction<typeof readFile>;
+const mockStat = stat as jest.MockedFunction<typeof stat>;
+
+// Each test sees a "modified" file so the mtime-keyed cache never leaks between tests
+let mtimeMs = 0;
+const mockMtime = (value: number) =>
+  mockStat.mockResolvedValue({ mtimeMs: value } as Awaited<ReturnType<typeof stat>>);
 
 describe('loadConfig', () => {
   beforeEach(() => {
     jest.clearAllMocks();
+    mockMtime(++mtimeMs);
   });
 
   describe('Successful Config Loading', () => {
@@ -283,4 +290,39 @@ describe('loadConfig', () => {
       expect(result.escaped).toBe('quote: " backslash: \\');
     });
   });
+
+  describe('Caching', () => {
+    it('should not re-read the file while its mtime is unchanged', async () => {
+      mockReadFile.mockResolvedValue('{"params": {"physical": {"radius_scale": 1.0}}}');
+
+      const first = await loadConfig();
+      const second = await loadConfig();
+
+      expect(mockReadFile).toHaveBeenCalledTimes(1);
+      expect(second).toEqual(first);
+    });
+
+    it('should re-read the file when its mtime changes', async () => {
+      mockReadFile.mockResolvedValueOnce('{"version": 1}');
+      mockReadFile.mockResolvedValueOnce('{"version": 2}');
+
+      const first = await loadConfig();
+      mockMtime(++mtimeMs);
+      const second = await loadConfig();
+
+      expect(mockReadFile).toHaveBeenCalledTimes(2);
+      expect(first.version).toBe(1);
+      expect(second.version).toBe(2);
+    });
+
+    it('should return independent copies of the cached config', async () => {
+      mockReadFile.mockResolvedValue('{"params": {"physical": {"radius_scale": 1.0}}}');
+
+      const first = await loadConfig();
+      first.params.physical.radius_scale = 2.5;
+      const second = await loadConfig();
+
+      expect(second.params.physical.radius_scale).toBe(1.0);
+    });
+  });
 });